@@ -1,9 +1,12 @@
 import pygame
+import numpy as np
 import random
 import sys
 import json
 import os
+import itertools
 import math
+from collections import Counter, OrderedDict, deque
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict
@@ -19,6 +22,36 @@ WINDOW_HEIGHT = 800
 GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
+INPUT_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE]
+
+# Draw many (surface, position) pairs in one call. Surface.fblits (pygame-ce) is the
+# cheapest batch blit; plain pygame only has blits, so skip building its return list
+if hasattr(pygame.Surface, "fblits"):
+    def blit_batch(surface, items):
+        surface.fblits(items)
+else:
+    def blit_batch(surface, items):
+        surface.blits(items, doreturn=False)
+
+# Top-left position that centers a surface on a point, without building a Rect
+def centered_pos(surface, center_x, center_y):
+    return (center_x - surface.get_width() // 2, center_y - surface.get_height() // 2)
+
+# |sin| over one period, for pulsing effects without per-frame trig
+PULSE_STEPS = 256
+PULSE_TABLE = tuple(abs(math.sin(2 * math.pi * i / PULSE_STEPS)) for i in range(PULSE_STEPS))
+PULSE_INDEX_SCALE = PULSE_STEPS / (2 * math.pi)
+
+# Shared dirty rects for every grid cell, grown by a margin, so per-frame
+# redraw bookkeeping reuses them instead of allocating new Rects. Treat as read-only
+def build_cell_rects(margin):
+    return {(gx, gy): pygame.Rect(gx * GRID_SIZE - margin, gy * GRID_SIZE - margin,
+                                  GRID_SIZE + 2 * margin, GRID_SIZE + 2 * margin)
+            for gx in range(GRID_WIDTH) for gy in range(GRID_HEIGHT)}
+
+CELL_RECTS = build_cell_rects(0)
+HEAD_RECTS = build_cell_rects(2)  # head plus invulnerability glow
+FOOD_RECTS = build_cell_rects(3)  # largest food pulse
 
 # Colors
 class Colors:
@@ -47,6 +80,10 @@ class GameState(Enum):
     HIGH_SCORES = "high_scores"
     SETTINGS = "settings"
 
+# Screens that only change in response to input, so they are not redrawn every frame
+STATIC_STATES = frozenset({GameState.MENU, GameState.PAUSED, GameState.GAME_OVER,
+                           GameState.HIGH_SCORES, GameState.SETTINGS})
+
 class Difficulty(Enum):
     EASY = {"speed": 8, "multiplier": 1.0, "powerups": True}
     MEDIUM = {"speed": 12, "multiplier": 1.5, "powerups": True}
@@ -60,6 +97,34 @@ class PowerUpType(Enum):
     WALL_PHASE = "wall_phase"
     MULTIPLIER = "multiplier"
 
+POWERUP_TYPES = tuple(PowerUpType)
+
+POWERUP_COLORS = {
+    PowerUpType.SPEED_BOOST: Colors.YELLOW,
+    PowerUpType.SLOW_DOWN: Colors.BLUE,
+    PowerUpType.DOUBLE_POINTS: Colors.PURPLE,
+    PowerUpType.SHRINK: Colors.ORANGE,
+    PowerUpType.WALL_PHASE: Colors.CYAN,
+    PowerUpType.MULTIPLIER: Colors.PINK
+}
+
+# Fixed part of the settings screen, below the difficulty and sound lines,
+# with each line's color worked out up front
+SETTINGS_HELP_LINES = (
+    "Controls:",
+    "  Player 1: W/A/S/D",
+    "  Player 2: Arrow Keys",
+    "",
+    "Power-ups:",
+    "  Yellow: Speed Boost",
+    "  Blue: Slow Down",
+    "  Purple: Double Points",
+    "  Orange: Shrink Snake",
+    "  Cyan: Phase Through Walls"
+)
+SETTINGS_COLORS = (Colors.WHITE, Colors.WHITE) + tuple(
+    Colors.WHITE if line else Colors.LIGHT_GRAY for line in SETTINGS_HELP_LINES)
+
 @dataclass
 class PowerUp:
     type: PowerUpType
@@ -68,27 +133,98 @@ class PowerUp:
     spawn_time: float
     color: Tuple[int, int, int]
 
-class Particle:
-    def __init__(self, x, y, color, velocity, lifetime):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.lifetime = lifetime
-        self.age = 0
-        self.size = random.randint(2, 6)
+# All live particles, stored as parallel NumPy arrays so they update in bulk
+class ParticleSystem:
+    # Pre-drawn circle per (color, radius), shared by all particle systems
+    sprites = {}
+    
+    def __init__(self):
+        self.x = np.empty(0, dtype=np.float32)
+        self.y = np.empty(0, dtype=np.float32)
+        self.vx = np.empty(0, dtype=np.float32)
+        self.vy = np.empty(0, dtype=np.float32)
+        self.age = np.empty(0, dtype=np.float32)
+        self.lifetime = np.empty(0, dtype=np.float32)
+        self.size = np.empty(0, dtype=np.float32)
+        self.color = np.empty((0, 3), dtype=np.uint8)
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def emit(self, x, y, color, velocities, lifetime):
+        velocities = np.asarray(velocities, dtype=np.float32).reshape(-1, 2)
+        count = len(velocities)
+        self.x = np.concatenate((self.x, np.full(count, x, dtype=np.float32)))
+        self.y = np.concatenate((self.y, np.full(count, y, dtype=np.float32)))
+        self.vx = np.concatenate((self.vx, velocities[:, 0]))
+        self.vy = np.concatenate((self.vy, velocities[:, 1]))
+        self.age = np.concatenate((self.age, np.zeros(count, dtype=np.float32)))
+        self.lifetime = np.concatenate((self.lifetime, np.full(count, lifetime, dtype=np.float32)))
+        self.size = np.concatenate((self.size, np.random.randint(2, 7, count).astype(np.float32)))
+        self.color = np.concatenate((self.color, np.tile(np.array(color, dtype=np.uint8), (count, 1))))
     
     def update(self, dt):
+        if not len(self.x):
+            return
         self.age += dt
-        self.x += self.velocity[0] * dt
-        self.y += self.velocity[1] * dt
-        return self.age < self.lifetime
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        
+        alive = self.age < self.lifetime
+        if not alive.all():
+            self.x = self.x[alive]
+            self.y = self.y[alive]
+            self.vx = self.vx[alive]
+            self.vy = self.vy[alive]
+            self.age = self.age[alive]
+            self.lifetime = self.lifetime[alive]
+            self.size = self.size[alive]
+            self.color = self.color[alive]
+    
+    def get_sprite(self, color, size):
+        key = (color, size)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            sprite = sprite.convert_alpha()
+            self.sprites[key] = sprite
+        return sprite
     
     def draw(self, screen):
-        alpha = max(0, 255 * (1 - self.age / self.lifetime))
-        size = max(1, int(self.size * (1 - self.age / self.lifetime)))
-        color = (*self.color, int(alpha))
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
+        # Returns the screen area touched, for dirty-rect display updates
+        if not len(self.x):
+            return []
+        sizes = np.maximum(1, (self.size * (1 - self.age / self.lifetime)).astype(np.int32))
+        xs = self.x.astype(np.int32)
+        ys = self.y.astype(np.int32)
+        get_sprite = self.get_sprite
+        blit_batch(screen, [(get_sprite(color, size), (x - size, y - size))
+                            for x, y, color, size in zip(xs.tolist(),
+                                                         ys.tolist(),
+                                                         map(tuple, self.color.tolist()),
+                                                         sizes.tolist())])
+        left = int((xs - sizes).min())
+        top = int((ys - sizes).min())
+        return [pygame.Rect(left, top, int((xs + sizes).max()) - left, int((ys + sizes).max()) - top)]
+
+# Rendered text surfaces, reused while the text stays the same
+class TextCache:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+    
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
 
 class SoundManager:
     def __init__(self):
@@ -124,17 +260,17 @@ class SoundManager:
     
     def generate_tone(self, frequency, duration, sample_rate, wave_type):
         frames = int(duration * sample_rate)
-        arr = []
-        for i in range(frames):
-            time_val = float(i) / sample_rate
-            if wave_type == 'sine':
-                wave = 4096 * math.sin(frequency * 2 * math.pi * time_val)
-            elif wave_type == 'square':
-                wave = 4096 * (1 if math.sin(frequency * 2 * math.pi * time_val) > 0 else -1)
-            else:  # sawtooth
-                wave = 4096 * (2 * (time_val * frequency - math.floor(time_val * frequency + 0.5)))
-            arr.append([int(wave), int(wave)])
-        return arr
+        time_vals = np.arange(frames, dtype=np.float64) / sample_rate
+        if wave_type == 'sine':
+            wave = 4096 * np.sin(frequency * 2 * np.pi * time_vals)
+        elif wave_type == 'square':
+            wave = np.where(np.sin(frequency * 2 * np.pi * time_vals) > 0, 4096, -4096)
+        else:  # sawtooth
+            phase = time_vals * frequency
+            wave = 4096 * (2 * (phase - np.floor(phase + 0.5)))
+        wave = wave.astype(np.int16)
+        # make_sound needs a C-contiguous (frames, channels) buffer
+        return np.ascontiguousarray(np.column_stack((wave, wave)))
     
     def play_sound(self, sound_name):
         if sound_name in self.sounds:
@@ -143,11 +279,15 @@ class SoundManager:
             sound.play()
 
 class Snake:
-    def __init__(self, player_id: int, color: Tuple[int, int, int], controls: Dict, start_pos: Tuple[int, int]):
+    def __init__(self, player_id: int, color: Tuple[int, int, int], controls: Dict, start_pos: Tuple[int, int],
+                 particles: ParticleSystem):
         self.player_id = player_id
         self.color = color
         self.controls = controls
-        self.positions = [start_pos]
+        self.positions = deque([start_pos])
+        # Cell -> segment count, for O(1) "is this cell part of the body" checks.
+        # A count rather than a set because an invulnerable snake can overlap itself.
+        self.occupied = Counter([start_pos])
         self.direction = (1, 0)
         self.grow_pending = 0
         self.score = 0
@@ -157,7 +297,11 @@ class Snake:
         self.speed_multiplier = 1.0
         self.wall_phase = False
         self.last_move_time = 0
-        self.trail_particles = []
+        self.particles = particles
+        self.trail_tick = 0
+        # Body sprites for each darkness step; segments past the 25th share the darkest
+        self.segment_sprites = [self.build_segment_sprite(tuple(max(0, c - 2 * d) for c in color))
+                                for d in range(26)]
     
     def update(self, dt, current_time):
         # Update power-ups
@@ -173,53 +317,61 @@ class Snake:
         if self.invulnerable_time > 0:
             self.invulnerable_time -= dt
         
-        # Add trail particles
-        if len(self.positions) > 0:
+        # Add a trail particle every third frame
+        self.trail_tick += 1
+        if self.trail_tick % 3 == 0 and len(self.positions) > 0:
             head_x, head_y = self.positions[0]
-            if random.random() < 0.3:
-                particle = Particle(
-                    head_x * GRID_SIZE + GRID_SIZE // 2,
-                    head_y * GRID_SIZE + GRID_SIZE // 2,
-                    self.color,
-                    (random.randint(-20, 20), random.randint(-20, 20)),
-                    0.5
-                )
-                self.trail_particles.append(particle)
-        
-        # Update trail particles
-        self.trail_particles = [p for p in self.trail_particles if p.update(dt)]
+            rand = random.random
+            self.particles.emit(
+                head_x * GRID_SIZE + GRID_SIZE // 2,
+                head_y * GRID_SIZE + GRID_SIZE // 2,
+                self.color,
+                [(rand() * 40 - 20, rand() * 40 - 20)],
+                0.5
+            )
+        
+        return bool(expired_powerups)
     
     def move(self):
         if not self.alive:
             return True
         
         head_x, head_y = self.positions[0]
-        new_head = (head_x + self.direction[0], head_y + self.direction[1])
+        dx, dy = self.direction
+        new_x = head_x + dx
+        new_y = head_y + dy
         
         # Wall collision (unless wall phase is active)
-        if not self.wall_phase:
-            if (new_head[0] < 0 or new_head[0] >= GRID_WIDTH or 
-                new_head[1] < 0 or new_head[1] >= GRID_HEIGHT):
+        if not (0 <= new_x < GRID_WIDTH and 0 <= new_y < GRID_HEIGHT):
+            if not self.wall_phase:
                 self.alive = False
                 return False
-        else:
             # Wrap around if wall phase is active
-            new_head = (new_head[0] % GRID_WIDTH, new_head[1] % GRID_HEIGHT)
+            new_x %= GRID_WIDTH
+            new_y %= GRID_HEIGHT
+        new_head = (new_x, new_y)
         
         # Self collision (if not invulnerable)
-        if self.invulnerable_time <= 0 and new_head in self.positions:
+        occupied = self.occupied
+        if self.invulnerable_time <= 0 and new_head in occupied:
             self.alive = False
             return False
         
-        self.positions.insert(0, new_head)
+        self.positions.appendleft(new_head)
+        occupied[new_head] += 1
         
         if self.grow_pending > 0:
             self.grow_pending -= 1
         else:
-            self.positions.pop()
+            self.vacate(self.positions.pop())
         
         return True
     
+    def vacate(self, pos):
+        self.occupied[pos] -= 1
+        if not self.occupied[pos]:
+            del self.occupied[pos]
+    
     def change_direction(self, direction):
         # Prevent reverse direction
         if (direction[0] * -1, direction[1] * -1) != self.direction:
@@ -237,7 +389,9 @@ class Snake:
             self.speed_multiplier = 0.5
         elif powerup_type == PowerUpType.SHRINK:
             if len(self.positions) > 3:
-                self.positions = self.positions[:len(self.positions)//2]
+                # Drop the back half from the tail end
+                for _ in range(len(self.positions) - len(self.positions)//2):
+                    self.vacate(self.positions.pop())
         elif powerup_type == PowerUpType.WALL_PHASE:
             self.wall_phase = True
             self.invulnerable_time = 2.0
@@ -253,37 +407,43 @@ class Snake:
             elif powerup_type == PowerUpType.WALL_PHASE:
                 self.wall_phase = False
     
+    def build_segment_sprite(self, color):
+        sprite = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        sprite.fill(color)
+        pygame.draw.rect(sprite, Colors.BLACK, (0, 0, GRID_SIZE, GRID_SIZE), 1)
+        return sprite
+    
     def draw(self, screen):
-        # Draw trail particles
-        for particle in self.trail_particles:
-            particle.draw(screen)
+        # Draw head
+        head_x, head_y = self.positions[0]
+        x, y = head_x * GRID_SIZE, head_y * GRID_SIZE
+        color = self.color if self.alive else Colors.GRAY
+        # Add glow effect for head
+        if self.invulnerable_time > 0:
+            glow_color = Colors.WHITE
+            pygame.draw.rect(screen, glow_color, (x-2, y-2, GRID_SIZE+4, GRID_SIZE+4))
+        pygame.draw.rect(screen, color, (x, y, GRID_SIZE, GRID_SIZE))
+        # Draw eyes
+        eye_size = 3
+        pygame.draw.circle(screen, Colors.WHITE, (x + 5, y + 5), eye_size)
+        pygame.draw.circle(screen, Colors.WHITE, (x + 15, y + 5), eye_size)
+        pygame.draw.circle(screen, Colors.BLACK, (x + 5, y + 5), 1)
+        pygame.draw.circle(screen, Colors.BLACK, (x + 15, y + 5), 1)
+        # Border
+        pygame.draw.rect(screen, Colors.BLACK, (x, y, GRID_SIZE, GRID_SIZE), 1)
         
-        # Draw snake body
-        for i, pos in enumerate(self.positions):
-            x, y = pos[0] * GRID_SIZE, pos[1] * GRID_SIZE
-            
-            # Head is different from body
-            if i == 0:
-                color = self.color if self.alive else Colors.GRAY
-                # Add glow effect for head
-                if self.invulnerable_time > 0:
-                    glow_color = Colors.WHITE
-                    pygame.draw.rect(screen, glow_color, (x-2, y-2, GRID_SIZE+4, GRID_SIZE+4))
-                pygame.draw.rect(screen, color, (x, y, GRID_SIZE, GRID_SIZE))
-                # Draw eyes
-                eye_size = 3
-                pygame.draw.circle(screen, Colors.WHITE, (x + 5, y + 5), eye_size)
-                pygame.draw.circle(screen, Colors.WHITE, (x + 15, y + 5), eye_size)
-                pygame.draw.circle(screen, Colors.BLACK, (x + 5, y + 5), 1)
-                pygame.draw.circle(screen, Colors.BLACK, (x + 15, y + 5), 1)
-            else:
-                # Body segments get progressively darker
-                darkness = min(50, i * 2)
-                body_color = tuple(max(0, c - darkness) for c in self.color)
-                pygame.draw.rect(screen, body_color, (x, y, GRID_SIZE, GRID_SIZE))
-            
-            # Border
-            pygame.draw.rect(screen, Colors.BLACK, (x, y, GRID_SIZE, GRID_SIZE), 1)
+        # Draw body in one batch; segments get progressively darker
+        sprites = itertools.chain(self.segment_sprites[1:], itertools.repeat(self.segment_sprites[-1]))
+        blit_batch(screen, [(sprite, (pos[0] * GRID_SIZE, pos[1] * GRID_SIZE))
+                            for sprite, pos in zip(sprites, itertools.islice(self.positions, 1, None))])
+        
+        # Only the head, the still-darkening segments and the tail change between
+        # frames; everything further back looks the same after a move
+        changed = itertools.chain(itertools.islice(self.positions, 1, len(self.segment_sprites)),
+                                  (self.positions[-1],))
+        dirty = [HEAD_RECTS[self.positions[0]]]
+        dirty.extend(map(CELL_RECTS.__getitem__, changed))
+        return dirty
 
 class Food:
     def __init__(self):
@@ -302,13 +462,15 @@ class Food:
         x, y = self.position[0] * GRID_SIZE, self.position[1] * GRID_SIZE
         
         # Pulsing effect
-        pulse = abs(math.sin(self.pulse_time))
+        pulse = PULSE_TABLE[int(self.pulse_time * PULSE_INDEX_SCALE) & (PULSE_STEPS - 1)]
         size_offset = int(3 * pulse)
         
         pygame.draw.rect(screen, self.color, 
                         (x - size_offset, y - size_offset, 
                          GRID_SIZE + 2*size_offset, GRID_SIZE + 2*size_offset))
         pygame.draw.rect(screen, Colors.BLACK, (x, y, GRID_SIZE, GRID_SIZE), 1)
+        
+        return [FOOD_RECTS[self.position]]
 
 class PowerUpManager:
     def __init__(self):
@@ -329,26 +491,16 @@ class PowerUpManager:
             self.spawn_timer = 0
     
     def spawn_powerup(self, current_time):
-        powerup_types = list(PowerUpType)
-        powerup_type = random.choice(powerup_types)
+        powerup_type = random.choice(POWERUP_TYPES)
         
         position = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
         
-        color_map = {
-            PowerUpType.SPEED_BOOST: Colors.YELLOW,
-            PowerUpType.SLOW_DOWN: Colors.BLUE,
-            PowerUpType.DOUBLE_POINTS: Colors.PURPLE,
-            PowerUpType.SHRINK: Colors.ORANGE,
-            PowerUpType.WALL_PHASE: Colors.CYAN,
-            PowerUpType.MULTIPLIER: Colors.PINK
-        }
-        
         powerup = PowerUp(
             type=powerup_type,
             position=position,
             duration=5.0,
             spawn_time=current_time,
-            color=color_map[powerup_type]
+            color=POWERUP_COLORS[powerup_type]
         )
         
         self.active_powerups.append(powerup)
@@ -361,6 +513,7 @@ class PowerUpManager:
         return None
     
     def draw(self, screen, current_time):
+        dirty = []
         for powerup in self.active_powerups:
             x, y = powerup.position[0] * GRID_SIZE, powerup.position[1] * GRID_SIZE
             
@@ -376,11 +529,15 @@ class PowerUpManager:
             if powerup.type == PowerUpType.SPEED_BOOST:
                 pygame.draw.polygon(screen, Colors.WHITE, 
                                   [(center_x-5, center_y-3), (center_x+5, center_y), (center_x-5, center_y+3)])
+            dirty.append(CELL_RECTS[powerup.position])
+        return dirty
 
 class HighScoreManager:
     def __init__(self):
         self.high_scores_file = "snake_high_scores.json"
         self.high_scores = self.load_high_scores()
+        self.display_lines = {}  # mode -> formatted rows, dropped whenever that mode's scores change
+        self.on_change = None  # optional callback run after the scores change
     
     def load_high_scores(self):
         try:
@@ -402,16 +559,30 @@ class HighScoreManager:
         self.high_scores[mode].append({"name": player_name, "score": score, "time": time.time()})
         self.high_scores[mode].sort(key=lambda x: x["score"], reverse=True)
         self.high_scores[mode] = self.high_scores[mode][:10]  # Keep top 10
+        self.display_lines.pop(mode, None)
         self.save_high_scores()
+        if self.on_change:
+            self.on_change()
+    
+    def get_display_lines(self, mode="single"):
+        lines = self.display_lines.get(mode)
+        if lines is None:
+            lines = [f"{i+1}. {score_data['name']}: {score_data['score']}"
+                     for i, score_data in enumerate(self.high_scores[mode][:10])]
+            self.display_lines[mode] = lines
+        return lines
 
 class MenuSystem:
-    def __init__(self, screen, font, sound_manager):
+    def __init__(self, screen, font, sound_manager, text_cache):
         self.screen = screen
         self.font = font
         self.large_font = pygame.font.Font(None, 72)
+        self.small_font = pygame.font.Font(None, 24)
         self.sound_manager = sound_manager
+        self.text_cache = text_cache
         self.selected_option = 0
         self.menu_options = ["Single Player", "Multiplayer", "High Scores", "Settings", "Quit"]
+        self.options_area = pygame.Rect(0, 270, WINDOW_WIDTH, len(self.menu_options) * 60)
         self.settings_options = ["Difficulty: Easy", "Sound: On", "Back"]
         self.difficulty = Difficulty.EASY
         self.sound_enabled = True
@@ -427,19 +598,17 @@ class MenuSystem:
         return None
     
     def draw_menu(self):
+        cx = WINDOW_WIDTH // 2
+        blit, render = self.screen.blit, self.text_cache.render
         self.screen.fill(Colors.BLACK)
         
         # Title
-        title = self.large_font.render("SNAKE MASTER", True, Colors.NEON_GREEN)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH//2, 150))
-        self.screen.blit(title, title_rect)
+        title = render(self.large_font, "SNAKE MASTER", Colors.NEON_GREEN)
+        title_pos = centered_pos(title, cx, 150)
+        blit(title, title_pos)
         
         # Menu options
-        for i, option in enumerate(self.menu_options):
-            color = Colors.WHITE if i == self.selected_option else Colors.GRAY
-            text = self.font.render(option, True, color)
-            text_rect = text.get_rect(center=(WINDOW_WIDTH//2, 300 + i*60))
-            self.screen.blit(text, text_rect)
+        self.draw_options()
         
         # Instructions
         instructions = [
@@ -450,14 +619,32 @@ class MenuSystem:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = pygame.font.Font(None, 24).render(instruction, True, Colors.LIGHT_GRAY)
-            text_rect = text.get_rect(center=(WINDOW_WIDTH//2, 600 + i*25))
-            self.screen.blit(text, text_rect)
+            text = render(self.small_font, instruction, Colors.LIGHT_GRAY)
+            text_pos = centered_pos(text, cx, 600 + i*25)
+            blit(text, text_pos)
+    
+    def draw_options(self):
+        # Only the option list changes while the menu is open, so it can be
+        # repainted on its own; returns the area to push to the display
+        cx = WINDOW_WIDTH // 2
+        blit, render = self.screen.blit, self.text_cache.render
+        self.screen.fill(Colors.BLACK, self.options_area)
+        for i, option in enumerate(self.menu_options):
+            color = Colors.WHITE if i == self.selected_option else Colors.GRAY
+            text = render(self.font, option, color)
+            text_pos = centered_pos(text, cx, 300 + i*60)
+            blit(text, text_pos)
+        return [self.options_area]
 
 class Game:
     def __init__(self):
+        # A plain software window: SCALED/vsync would route presents through the SDL
+        # renderer, which ignores update() rects and defeats the dirty-rect updates
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Snake Master - Multiplayer Edition")
+        # Only quit, key presses and window exposure are handled; keep everything else out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(INPUT_EVENTS)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
@@ -468,24 +655,72 @@ class Game:
         self.multiplayer = False
         
         # Managers
+        self.text_cache = TextCache()
         self.sound_manager = SoundManager()
-        self.menu_system = MenuSystem(self.screen, self.font, self.sound_manager)
+        self.menu_system = MenuSystem(self.screen, self.font, self.sound_manager, self.text_cache)
         self.high_score_manager = HighScoreManager()
+        self.high_score_manager.on_change = self.invalidate_high_scores_screen
         self.powerup_manager = PowerUpManager()
         
         # Game objects
         self.snakes = []
         self.food = None
-        self.particles = []
+        self.particles = ParticleSystem()
+        
+        # Fastest alive snake's speed multiplier, refreshed when power-ups or deaths change it
+        self._max_speed_mult = 1.0
         
         # Timing
         self.last_update_time = time.time()
         self.move_timer = 0
         
+        self._all_cells = frozenset(itertools.product(range(GRID_WIDTH), range(GRID_HEIGHT)))
+        
+        # Static background (grid never changes, so draw it once)
+        self._grid_bg = self.build_grid_background()
+        
+        # Screen areas drawn this frame and last frame while playing; a full flip
+        # is used whenever the whole picture may have changed
+        self._dirty_rects = []
+        self._prev_dirty_rects = []
+        self._last_drawn_state = None
+        self._full_redraw = True
+        self._needs_redraw = True
+        
+        # Pre-rendered text for the static screens, rebuilt when their contents change
+        self._game_over_cache = None
+        self._winner = None
+        self._score_colors = []
+        self._hs_cache = None
+        self._settings_cache = None
+        self._settings_key = None
+        
+        # Semi-transparent overlay for the pause and game over screens
+        self._overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._overlay.set_alpha(128)
+        self._overlay.fill(Colors.BLACK)
+        
         self.reset_game()
     
+    def build_grid_background(self):
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        background.fill(Colors.BLACK)
+        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
+            pygame.draw.line(background, Colors.DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT))
+        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
+            pygame.draw.line(background, Colors.DARK_GRAY, (0, y), (WINDOW_WIDTH, y))
+        return background
+    
+    def apply_difficulty(self, difficulty):
+        self.difficulty = difficulty
+        self._powerups_enabled = difficulty.value["powerups"]
+        self._diff_speed = difficulty.value["speed"]
+        self._diff_mult = difficulty.value["multiplier"]
+    
     def reset_game(self):
+        self.apply_difficulty(self.difficulty)
         self.snakes = []
+        self.particles = ParticleSystem()
         
         # Player 1 controls
         p1_controls = {
@@ -504,41 +739,60 @@ class Game:
         }
         
         # Create snakes
-        snake1 = Snake(1, Colors.NEON_GREEN, p1_controls, (GRID_WIDTH//4, GRID_HEIGHT//2))
+        snake1 = Snake(1, Colors.NEON_GREEN, p1_controls, (GRID_WIDTH//4, GRID_HEIGHT//2), self.particles)
         self.snakes.append(snake1)
         
         if self.multiplayer:
-            snake2 = Snake(2, Colors.NEON_BLUE, p2_controls, (3*GRID_WIDTH//4, GRID_HEIGHT//2))
+            snake2 = Snake(2, Colors.NEON_BLUE, p2_controls, (3*GRID_WIDTH//4, GRID_HEIGHT//2), self.particles)
             snake2.direction = (-1, 0)  # Start moving left
             self.snakes.append(snake2)
         
+        # Key -> (snake, direction) for every player's controls
+        self._key_to_snake_dir = {key: (snake, direction)
+                                  for snake in self.snakes
+                                  for key, direction in snake.controls.items()}
+        
         self.food = Food()
         self.powerup_manager = PowerUpManager()
-        self.particles = []
         self.move_timer = 0
+        self.refresh_speed_multiplier()
+        self._full_redraw = True
         
         # Ensure food doesn't spawn on snakes
         self.respawn_food()
     
+    def refresh_speed_multiplier(self):
+        self._max_speed_mult = max((snake.speed_multiplier for snake in self.snakes if snake.alive), default=1.0)
+    
     def respawn_food(self):
-        while True:
-            self.food.position = self.food.generate_position()
-            occupied = False
-            for snake in self.snakes:
-                if self.food.position in snake.positions:
-                    occupied = True
-                    break
-            if not occupied:
-                break
+        # A few blind guesses almost always land on a free cell
+        for _ in range(3):
+            position = self.food.generate_position()
+            if not any(position in snake.occupied for snake in self.snakes):
+                self.food.position = position
+                return
+        
+        # Crowded board: pick directly from the free cells
+        occupied = set().union(*(snake.occupied for snake in self.snakes))
+        free_cells = self._all_cells - occupied
+        if free_cells:
+            self.food.position = random.choice(tuple(free_cells))
     
     def handle_events(self):
         current_time = time.time()
         
-        for event in pygame.event.get():
+        for event in pygame.event.get(INPUT_EVENTS):
             if event.type == pygame.QUIT:
                 return False
             
-            elif event.type == pygame.KEYDOWN:
+            # Any key or exposure may change what a static screen shows
+            self._needs_redraw = True
+            # Exposed areas are damaged anywhere in the window, so partial
+            # presents are not enough; repaint and flip the whole frame
+            if event.type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True
+
+            if event.type == pygame.KEYDOWN:
                 if self.state == GameState.MENU:
                     action = self.menu_system.handle_menu_input(event)
                     if action == "Single Player":
@@ -561,9 +815,10 @@ class Game:
                         self.state = GameState.PAUSED
                     else:
                         # Handle snake controls
-                        for snake in self.snakes:
-                            if event.key in snake.controls:
-                                snake.change_direction(snake.controls[event.key])
+                        hit = self._key_to_snake_dir.get(event.key)
+                        if hit:
+                            snake, direction = hit
+                            snake.change_direction(direction)
                 
                 elif self.state == GameState.PAUSED:
                     if event.key == pygame.K_ESCAPE:
@@ -596,18 +851,22 @@ class Game:
             return
         
         # Update snakes
+        powerups_expired = False
         for snake in self.snakes:
-            snake.update(dt, current_time)
+            if snake.update(dt, current_time):
+                powerups_expired = True
+        if powerups_expired:
+            self.refresh_speed_multiplier()
         
         # Update food
         self.food.update(dt)
         
         # Update power-ups
-        if self.difficulty.value["powerups"]:
+        if self._powerups_enabled:
             self.powerup_manager.update(dt, current_time)
         
         # Move snakes based on difficulty
-        move_interval = 1.0 / (self.difficulty.value["speed"] * max(snake.speed_multiplier for snake in self.snakes if snake.alive))
+        move_interval = 1.0 / (self._diff_speed * self._max_speed_mult)
         self.move_timer += dt
         
         if self.move_timer >= move_interval:
@@ -619,22 +878,20 @@ class Game:
                 if not snake.move():
                     self.sound_manager.play_sound('game_over')
                     # Create death particles
-                    for pos in snake.positions[:5]:  # Only first 5 segments
-                        for _ in range(10):
-                            particle = Particle(
-                                pos[0] * GRID_SIZE + GRID_SIZE // 2,
-                                pos[1] * GRID_SIZE + GRID_SIZE // 2,
-                                snake.color,
-                                (random.randint(-100, 100), random.randint(-100, 100)),
-                                2.0
-                            )
-                            self.particles.append(particle)
+                    for pos in itertools.islice(snake.positions, 5):  # Only first 5 segments
+                        self.particles.emit(
+                            pos[0] * GRID_SIZE + GRID_SIZE // 2,
+                            pos[1] * GRID_SIZE + GRID_SIZE // 2,
+                            snake.color,
+                            np.random.randint(-100, 101, size=(10, 2)),
+                            2.0
+                        )
             
             # Check food collision
             for snake in alive_snakes:
                 if snake.positions[0] == self.food.position:
                     snake.grow(2)
-                    points = int(self.food.value * self.difficulty.value["multiplier"])
+                    points = int(self.food.value * self._diff_mult)
                     
                     # Double points power-up
                     if PowerUpType.DOUBLE_POINTS in snake.power_ups:
@@ -644,56 +901,75 @@ class Game:
                     self.sound_manager.play_sound('eat')
                     
                     # Create eat particles
-                    for _ in range(15):
-                        particle = Particle(
-                            self.food.position[0] * GRID_SIZE + GRID_SIZE // 2,
-                            self.food.position[1] * GRID_SIZE + GRID_SIZE // 2,
-                            Colors.RED,
-                            (random.randint(-50, 50), random.randint(-50, 50)),
-                            1.0
-                        )
-                        self.particles.append(particle)
+                    self.particles.emit(
+                        self.food.position[0] * GRID_SIZE + GRID_SIZE // 2,
+                        self.food.position[1] * GRID_SIZE + GRID_SIZE // 2,
+                        Colors.RED,
+                        np.random.randint(-50, 51, size=(15, 2)),
+                        1.0
+                    )
                     
                     self.respawn_food()
             
             # Check power-up collisions
-            if self.difficulty.value["powerups"]:
+            if self._powerups_enabled:
                 for snake in alive_snakes:
                     powerup = self.powerup_manager.check_collision(snake.positions[0])
                     if powerup:
                         snake.add_power_up(powerup.type, powerup.duration, current_time)
+                        # Shrinking removes cells outside the tracked dirty areas
+                        self._full_redraw = True
                         self.sound_manager.play_sound('powerup')
             
             # Check snake-to-snake collisions in multiplayer
             if self.multiplayer and len(alive_snakes) > 1:
-                for i, snake1 in enumerate(alive_snakes):
-                    for j, snake2 in enumerate(alive_snakes):
-                        if i != j and snake1.invulnerable_time <= 0:
-                            if snake1.positions[0] in snake2.positions:
-                                snake1.alive = False
-                                self.sound_manager.play_sound('game_over')
+                for snake in alive_snakes:
+                    if snake.invulnerable_time > 0:
+                        continue
+                    head = snake.positions[0]
+                    for other in alive_snakes:
+                        if other is not snake and head in other.occupied:
+                            snake.alive = False
+                            self.sound_manager.play_sound('game_over')
+            
+            # Pickups and deaths may have changed the fastest snake
+            self.refresh_speed_multiplier()
             
             # Check game over
             if not any(snake.alive for snake in self.snakes):
                 self.state = GameState.GAME_OVER
                 # Add high scores
                 if self.multiplayer:
-                    winner = max(self.snakes, key=lambda s: s.score)
+                    # Scores are final now, so the winner is picked once here
+                    self._winner = winner = max(self.snakes, key=lambda s: s.score)
+                    self._score_colors = [Colors.GREEN if snake is winner else Colors.WHITE
+                                          for snake in self.snakes]
                     self.high_score_manager.add_score(winner.score, f"Player {winner.player_id}", "multi")
                 else:
                     self.high_score_manager.add_score(self.snakes[0].score, "Player", "single")
+                self._game_over_cache = None
         
         # Update particles
-        self.particles = [p for p in self.particles if p.update(dt)]
+        self.particles.update(dt)
     
     def draw(self):
-        self.screen.fill(Colors.BLACK)
+        # Screen areas to push to the display, or None to flip the whole frame
+        partial = None
+        redrawing_same_screen = self._last_drawn_state == self.state and not self._full_redraw
         
         if self.state == GameState.MENU:
-            self.menu_system.draw_menu()
+            # Key presses only move the selection; entering the menu or an
+            # exposed window (_full_redraw) repaints title and instructions too
+            if redrawing_same_screen:
+                partial = self.menu_system.draw_options()
+            else:
+                self.menu_system.draw_menu()
         
         elif self.state == GameState.PLAYING:
             self.draw_game()
+            if redrawing_same_screen:
+                # This frame's drawing plus whatever it replaced
+                partial = self._prev_dirty_rects + self._dirty_rects
         
         elif self.state == GameState.PAUSED:
             self.draw_game()
@@ -709,41 +985,48 @@ class Game:
         elif self.state == GameState.SETTINGS:
             self.draw_settings()
         
-        pygame.display.flip()
+        if partial is not None:
+            pygame.display.update(partial)
+        else:
+            pygame.display.flip()
+            self._full_redraw = False
+        self._last_drawn_state = self.state
     
     def draw_game(self):
-        # Draw grid
-        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, Colors.DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT))
-        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, Colors.DARK_GRAY, (0, y), (WINDOW_WIDTH, y))
+        self._prev_dirty_rects = self._dirty_rects
+        self._dirty_rects = dirty = []
+        
+        # Draw grid (also clears the previous frame)
+        self.screen.blit(self._grid_bg, (0, 0))
         
-        # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        # Draw particles (including snake trails)
+        dirty += self.particles.draw(self.screen)
         
         # Draw food
-        self.food.draw(self.screen)
+        dirty += self.food.draw(self.screen)
         
         # Draw power-ups
-        if self.difficulty.value["powerups"]:
-            self.powerup_manager.draw(self.screen, time.time())
+        if self._powerups_enabled:
+            dirty += self.powerup_manager.draw(self.screen, time.time())
         
         # Draw snakes
         for snake in self.snakes:
-            snake.draw(self.screen)
+            dirty += snake.draw(self.screen)
         
         # Draw UI
-        self.draw_ui()
+        dirty += self.draw_ui()
     
     def draw_ui(self):
+        dirty = []
+        blit, render = self.screen.blit, self.text_cache.render
+        
         # Draw scores
         y_offset = 10
         for i, snake in enumerate(self.snakes):
             color = snake.color if snake.alive else Colors.GRAY
             score_text = f"Player {snake.player_id}: {snake.score}"
-            text = self.font.render(score_text, True, color)
-            self.screen.blit(text, (10, y_offset + i * 40))
+            text = render(self.font, score_text, color)
+            dirty.append(blit(text, (10, y_offset + i * 40)))
             
             # Draw active power-ups
             powerup_y = y_offset + i * 40 + 25
@@ -755,36 +1038,37 @@ class Game:
                 if remaining > 0:
                     powerup_name = powerup_type.value.replace('_', ' ').title()
                     powerup_text = f"{powerup_name}: {remaining:.1f}s"
-                    text = self.small_font.render(powerup_text, True, Colors.YELLOW)
-                    self.screen.blit(text, (x_offset, powerup_y))
+                    text = render(self.small_font, powerup_text, Colors.YELLOW)
+                    dirty.append(blit(text, (x_offset, powerup_y)))
                     x_offset += text.get_width() + 15
         
         # Draw difficulty and mode
         diff_text = f"Difficulty: {self.difficulty.name}"
         mode_text = f"Mode: {'Multiplayer' if self.multiplayer else 'Single Player'}"
         
-        diff_surface = self.small_font.render(diff_text, True, Colors.WHITE)
-        mode_surface = self.small_font.render(mode_text, True, Colors.WHITE)
+        diff_surface = render(self.small_font, diff_text, Colors.WHITE)
+        mode_surface = render(self.small_font, mode_text, Colors.WHITE)
         
-        self.screen.blit(diff_surface, (WINDOW_WIDTH - 200, 10))
-        self.screen.blit(mode_surface, (WINDOW_WIDTH - 200, 35))
+        dirty.append(blit(diff_surface, (WINDOW_WIDTH - 200, 10)))
+        dirty.append(blit(mode_surface, (WINDOW_WIDTH - 200, 35)))
         
         # Draw controls hint
         controls_text = "ESC: Pause"
-        controls_surface = self.small_font.render(controls_text, True, Colors.LIGHT_GRAY)
-        self.screen.blit(controls_surface, (WINDOW_WIDTH - 200, WINDOW_HEIGHT - 30))
+        controls_surface = render(self.small_font, controls_text, Colors.LIGHT_GRAY)
+        dirty.append(blit(controls_surface, (WINDOW_WIDTH - 200, WINDOW_HEIGHT - 30)))
+        
+        return dirty
     
     def draw_pause_overlay(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Colors.BLACK)
-        self.screen.blit(overlay, (0, 0))
+        cx, cy = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
+        blit, render = self.screen.blit, self.text_cache.render
+        blit(self._overlay, (0, 0))
         
         # Pause text
-        pause_text = self.font.render("PAUSED", True, Colors.WHITE)
-        pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-        self.screen.blit(pause_text, pause_rect)
+        pause_text = render(self.font, "PAUSED", Colors.WHITE)
+        pause_pos = centered_pos(pause_text, cx, cy - 50)
+        blit(pause_text, pause_pos)
         
         # Instructions
         instructions = [
@@ -794,41 +1078,41 @@ class Game:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = self.small_font.render(instruction, True, Colors.WHITE)
-            text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + i*30))
-            self.screen.blit(text, text_rect)
+            text = render(self.small_font, instruction, Colors.WHITE)
+            text_pos = centered_pos(text, cx, cy + i*30)
+            blit(text, text_pos)
     
     def draw_game_over(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Colors.BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
+        
+        if self._game_over_cache is None:
+            self._game_over_cache = self.build_game_over_screen()
+        blit_batch(self.screen, self._game_over_cache)
+    
+    def build_game_over_screen(self):
+        cx, cy = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
+        items = []
         
         # Game Over text
-        game_over_text = self.font.render("GAME OVER", True, Colors.RED)
-        game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 100))
-        self.screen.blit(game_over_text, game_over_rect)
+        game_over_text = self.font.render("GAME OVER", True, Colors.RED).convert_alpha()
+        items.append((game_over_text, centered_pos(game_over_text, cx, cy - 100)))
         
         # Final scores
         if self.multiplayer:
-            winner = max(self.snakes, key=lambda s: s.score)
+            winner = self._winner
             winner_text = f"Winner: Player {winner.player_id} with {winner.score} points!"
-            winner_surface = self.font.render(winner_text, True, Colors.YELLOW)
-            winner_rect = winner_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-            self.screen.blit(winner_surface, winner_rect)
+            winner_surface = self.font.render(winner_text, True, Colors.YELLOW).convert_alpha()
+            items.append((winner_surface, centered_pos(winner_surface, cx, cy - 50)))
             
-            for i, snake in enumerate(self.snakes):
+            for i, (snake, color) in enumerate(zip(self.snakes, self._score_colors)):
                 score_text = f"Player {snake.player_id}: {snake.score}"
-                color = Colors.GREEN if snake == winner else Colors.WHITE
-                text = self.small_font.render(score_text, True, color)
-                text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 10 + i*25))
-                self.screen.blit(text, text_rect)
+                text = self.small_font.render(score_text, True, color).convert_alpha()
+                items.append((text, centered_pos(text, cx, cy - 10 + i*25)))
         else:
             final_score = f"Final Score: {self.snakes[0].score}"
-            score_surface = self.font.render(final_score, True, Colors.WHITE)
-            score_rect = score_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-            self.screen.blit(score_surface, score_rect)
+            score_surface = self.font.render(final_score, True, Colors.WHITE).convert_alpha()
+            items.append((score_surface, centered_pos(score_surface, cx, cy - 50)))
         
         # Instructions
         instructions = [
@@ -837,93 +1121,128 @@ class Game:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = self.small_font.render(instruction, True, Colors.WHITE)
-            text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 50 + i*30))
-            self.screen.blit(text, text_rect)
+            text = self.small_font.render(instruction, True, Colors.WHITE).convert_alpha()
+            items.append((text, centered_pos(text, cx, cy + 50 + i*30)))
+        
+        return items
     
     def draw_high_scores(self):
-        self.screen.fill(Colors.BLACK)
+        if self._hs_cache is None:
+            self._hs_cache = self.build_high_scores_screen()
+        self.screen.blit(self._hs_cache, (0, 0))
+    
+    def invalidate_high_scores_screen(self):
+        self._hs_cache = None
+    
+    def build_high_scores_screen(self):
+        items = []
+        cx, cx_l, cx_r = WINDOW_WIDTH // 2, WINDOW_WIDTH // 4, 3 * WINDOW_WIDTH // 4
+        # Rows that would land entirely above or below the screen are left out of the batch
+        screen_height = self.screen.get_height()
+        render = self.small_font.render
         
         # Title
-        title = self.font.render("HIGH SCORES", True, Colors.YELLOW)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH//2, 100))
-        self.screen.blit(title, title_rect)
+        title = self.font.render("HIGH SCORES", True, Colors.YELLOW, Colors.BLACK).convert()
+        items.append((title, centered_pos(title, cx, 100)))
         
         # Single player scores
-        single_title = self.small_font.render("Single Player", True, Colors.WHITE)
-        single_rect = single_title.get_rect(center=(WINDOW_WIDTH//4, 180))
-        self.screen.blit(single_title, single_rect)
+        single_title = render("Single Player", True, Colors.WHITE, Colors.BLACK).convert()
+        items.append((single_title, centered_pos(single_title, cx_l, 180)))
         
-        for i, score_data in enumerate(self.high_score_manager.high_scores["single"][:10]):
-            score_text = f"{i+1}. {score_data['name']}: {score_data['score']}"
-            text = self.small_font.render(score_text, True, Colors.WHITE)
-            text_rect = text.get_rect(center=(WINDOW_WIDTH//4, 220 + i*30))
-            self.screen.blit(text, text_rect)
+        for i, score_text in enumerate(self.high_score_manager.get_display_lines("single")):
+            text = render(score_text, True, Colors.WHITE, Colors.BLACK).convert()
+            text_pos = centered_pos(text, cx_l, 220 + i*30)
+            if -text.get_height() < text_pos[1] < screen_height:
+                items.append((text, text_pos))
         
         # Multiplayer scores
-        multi_title = self.small_font.render("Multiplayer", True, Colors.WHITE)
-        multi_rect = multi_title.get_rect(center=(3*WINDOW_WIDTH//4, 180))
-        self.screen.blit(multi_title, multi_rect)
+        multi_title = render("Multiplayer", True, Colors.WHITE, Colors.BLACK).convert()
+        items.append((multi_title, centered_pos(multi_title, cx_r, 180)))
         
-        for i, score_data in enumerate(self.high_score_manager.high_scores["multi"][:10]):
-            score_text = f"{i+1}. {score_data['name']}: {score_data['score']}"
-            text = self.small_font.render(score_text, True, Colors.WHITE)
-            text_rect = text.get_rect(center=(3*WINDOW_WIDTH//4, 220 + i*30))
-            self.screen.blit(text, text_rect)
+        for i, score_text in enumerate(self.high_score_manager.get_display_lines("multi")):
+            text = render(score_text, True, Colors.WHITE, Colors.BLACK).convert()
+            text_pos = centered_pos(text, cx_r, 220 + i*30)
+            if -text.get_height() < text_pos[1] < screen_height:
+                items.append((text, text_pos))
         
         # Back instruction
-        back_text = self.small_font.render("Press ESC to return to menu", True, Colors.LIGHT_GRAY)
-        back_rect = back_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT - 50))
-        self.screen.blit(back_text, back_rect)
+        back_text = render("Press ESC to return to menu", True, Colors.LIGHT_GRAY, Colors.BLACK).convert()
+        items.append((back_text, centered_pos(back_text, cx, WINDOW_HEIGHT - 50)))
+        
+        # Composite the whole screen once so drawing it is a single blit
+        surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        surface.fill(Colors.BLACK)
+        blit_batch(surface, items)
+        return surface
     
     def draw_settings(self):
-        self.screen.fill(Colors.BLACK)
+        # Rebuild only when a displayed setting changes
+        settings_key = (self.difficulty, self.sound_manager.sfx_volume > 0)
+        if self._settings_cache is None or self._settings_key != settings_key:
+            self._settings_cache = self.build_settings_screen()
+            self._settings_key = settings_key
+        self.screen.blit(self._settings_cache, (0, 0))
+    
+    def build_settings_screen(self):
+        cx = WINDOW_WIDTH // 2
+        render = self.small_font.render
+        items = []
         
         # Title
-        title = self.font.render("SETTINGS", True, Colors.YELLOW)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH//2, 100))
-        self.screen.blit(title, title_rect)
+        title = self.font.render("SETTINGS", True, Colors.YELLOW, Colors.BLACK).convert()
+        items.append((title, centered_pos(title, cx, 100)))
         
         # Settings options
-        settings = [
+        settings = (
             f"Difficulty: {self.difficulty.name}",
             f"Sound: {'On' if self.sound_manager.sfx_volume > 0 else 'Off'}",
-            "Controls:",
-            "  Player 1: W/A/S/D",
-            "  Player 2: Arrow Keys",
-            "",
-            "Power-ups:",
-            "  Yellow: Speed Boost",
-            "  Blue: Slow Down", 
-            "  Purple: Double Points",
-            "  Orange: Shrink Snake",
-            "  Cyan: Phase Through Walls"
-        ]
+        ) + SETTINGS_HELP_LINES
         
-        for i, setting in enumerate(settings):
-            color = Colors.WHITE if setting else Colors.LIGHT_GRAY
-            text = self.small_font.render(setting, True, color)
-            text_rect = text.get_rect(center=(WINDOW_WIDTH//2, 180 + i*30))
-            self.screen.blit(text, text_rect)
+        for i, (setting, color) in enumerate(zip(settings, SETTINGS_COLORS)):
+            text = render(setting, True, color, Colors.BLACK).convert()
+            items.append((text, centered_pos(text, cx, 180 + i*30)))
         
         # Back instruction
-        back_text = self.small_font.render("Press ESC to return to menu", True, Colors.LIGHT_GRAY)
-        back_rect = back_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT - 50))
-        self.screen.blit(back_text, back_rect)
+        back_text = render("Press ESC to return to menu", True, Colors.LIGHT_GRAY, Colors.BLACK).convert()
+        items.append((back_text, centered_pos(back_text, cx, WINDOW_HEIGHT - 50)))
+        
+        # Composite the whole screen once so drawing it is a single blit
+        surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        surface.fill(Colors.BLACK)
+        blit_batch(surface, items)
+        return surface
     
     def run(self):
-        running = True
+        try:
+            self.main_loop()
+        finally:
+            pygame.quit()
+    
+    def main_loop(self):
+        # The per-frame loop lives in its own function so run() only handles
+        # shutdown
+        handle_events, update, draw = self.handle_events, self.update, self.draw
+        tick, tick_busy_loop = self.clock.tick, self.clock.tick_busy_loop
+        playing = GameState.PLAYING
         
+        running = True
         while running:
-            running = self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)  # 60 FPS for smooth gameplay
-        
-        pygame.quit()
-        sys.exit()
+            running = handle_events()
+            update()
+            state = self.state
+            if (state not in STATIC_STATES or self._needs_redraw
+                    or state != self._last_drawn_state):
+                draw()
+                self._needs_redraw = False
+            if state is playing:
+                # Precise pacing for smooth gameplay (60 FPS)
+                tick_busy_loop(60)
+            else:
+                # Sleep between menu frames rather than spin
+                tick(60)
 
 # Run the game
 if __name__ == "__main__":
     game = Game()
-    game.run()
\ No newline at end of file
+    game.run()
+    sys.exit()
\ No newline at end of file